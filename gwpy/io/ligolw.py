@@ -22,90 +22,170 @@ All specific unified input/output for class objects should be placed in
 an 'io' subdirectory of the containing directory for that class.
 """
 
-import builtins
 import importlib
 import os
 import os.path
 import re
+import sys
 from contextlib import contextmanager
-from functools import wraps
+from functools import (lru_cache, wraps)
 from importlib import import_module
+from itertools import chain
 from numbers import Integral
+from xml.etree.ElementTree import iterparse
 
 import numpy
 
+# keep a reference to the real ligo.lw.ligolw module, imported before
+# any ilwdchar_compat aliasing can be active (see _get_ligolw_types)
 try:
-    from ligo.lw.ligolw import (
-        ElementError as LigolwElementError,
-        LIGOLWContentHandler,
-    )
+    from ligo.lw import ligolw as _ligolw_ligolw
 except ImportError:  # no ligo.lw
+    _ligolw_ligolw = None
     LigolwElementError = None
     LIGOLWContentHandler = None
+else:
+    LigolwElementError = _ligolw_ligolw.ElementError
+    LIGOLWContentHandler = _ligolw_ligolw.LIGOLWContentHandler
 
-from .utils import (file_list, FILE_LIKE)
+from .utils import (file_list, gopen, FILE_LIKE)
 from ..utils.decorators import deprecated_function
 
 __author__ = 'Duncan Macleod <duncan.macleod@ligo.org>'
 
-# record actual import function
-_real_import = builtins.__import__
-
 # XML elements
 XML_SIGNATURE = b'<?xml'
 LIGOLW_SIGNATURE = b'<!doctype ligo_lw'
 LIGOLW_ELEMENT = b'<ligo_lw>'
 
-LIGO_LW_MODULE_REGEX = re.compile(r"\Aligo.lw")
-
 # regex to catch all errors associated with reading an old-format file
-# with the new library
-_compat_errors = {
+# with the new library; ordered so that the most common error comes
+# first in the compiled alternation
+_compat_errors = (
     r"invalid Column \'process_id\'",
     r"invalid Column \'coinc_event_id'",
     r"invalid Column \'coinc_def_id'",
     r"invalid Column \'event_id'",
-    r"invalid type \'ilwd:char\'"
-}
-LIGO_LW_COMPAT_ERROR = re.compile("({})".format("|".join(_compat_errors)))
+    r"invalid type \'ilwd:char\'",
+)
+LIGO_LW_COMPAT_ERROR = re.compile("|".join(_compat_errors), re.IGNORECASE)
+
+# precompute the ToPyType mapping linking LIGO_LW types to numpy dtypes,
+# so that read_ligolw() can swap it in without rebuilding it on each call
+try:
+    from ligo.lw import types as _ligolw_types
+except ImportError:  # no ligo.lw
+    _TOPYTYPE = _NUMPY_TOPYTYPE = None
+    _LLW_TO_NUMPY_SCALAR = {}
+else:
+    _TOPYTYPE = _ligolw_types.ToPyType
+    _NUMPY_TOPYTYPE = {
+        key: (
+            numpy.dtype(_ligolw_types.ToNumPyType[key]).type
+            if key in _ligolw_types.ToNumPyType
+            else pytype
+        )
+        for key, pytype in _TOPYTYPE.items()
+    }
+    # and the numpy scalar type for each LIGO_LW type, so that the
+    # write path can skip the string-keyed numpy.sctypeDict lookup
+    _LLW_TO_NUMPY_SCALAR = {
+        key: numpy.dtype(npname).type
+        for key, npname in _ligolw_types.ToNumPyType.items()
+    }
+
 
+# -- module aliasing to support ligo.lw and glue.ligolw concurrently ----------
 
-# -- import hackery to support ligo.lw and glue.ligolw concurrently -----------
+# map of ligo.lw module names to their glue.ligolw equivalents,
+# populated on first use of ilwdchar_compat mode
+_LIGOLW_COMPAT_MODULES = {}
 
-def _ligolw_compat_import(name, *args, **kwargs):
-    name = LIGO_LW_MODULE_REGEX.sub("glue.ligolw", name)
-    return _real_import(name, *args, **kwargs)
+
+def _ligolw_compat_modules():
+    """Return the `dict` of ``glue.ligolw`` modules aliased to ``ligo.lw``
+
+    The modules are imported once on first use, and cached for the
+    lifetime of the process.
+    """
+    if not _LIGOLW_COMPAT_MODULES:
+        base = importlib.import_module("glue.ligolw")
+        _LIGOLW_COMPAT_MODULES["ligo.lw"] = base
+        for suffix in (
+            ".array",
+            ".ilwd",
+            "._ilwd",
+            ".ligolw",
+            ".lsctables",
+            ".param",
+            ".table",
+            ".types",
+            ".utils",
+            ".utils.ligolw_add",
+        ):
+            try:
+                mod = importlib.import_module("glue.ligolw" + suffix)
+            except ImportError:  # pragma: no cover
+                continue
+            _LIGOLW_COMPAT_MODULES["ligo.lw" + suffix] = mod
+    return _LIGOLW_COMPAT_MODULES
+
+
+def _import_ligolw(name):
+    """Return a ``ligo.lw`` module, preferring the `sys.modules` entry
+
+    Under `ilwdchar_compat` the ``ligo.lw`` names in `sys.modules` are
+    aliased to their ``glue.ligolw`` equivalents, so resolving through
+    `sys.modules` keeps compat handling intact while skipping the
+    import machinery on hot paths.
+    """
+    try:
+        return sys.modules[name]
+    except KeyError:
+        return importlib.import_module(name)
 
 
 def _is_glue_ligolw_object(obj):
-    if not isinstance(obj, type):
-        obj = type(obj)
-    return str(obj.__module__).startswith("glue.ligolw")
+    mod = (obj if isinstance(obj, type) else type(obj)).__module__
+    return mod is not None and mod.startswith("glue.ligolw")
 
 
 def ilwdchar_compat(func):
     @wraps(func)
     def wrapped(*args, **kwargs):
-        use_compat = kwargs.pop(
-            "ilwdchar_compat",
-            any(map(
-                _is_glue_ligolw_object,
-                list(args) + list(kwargs.values()),
-            )),
-        )
+        use_compat = kwargs.pop("ilwdchar_compat", None)
+        if use_compat is None:
+            use_compat = any(
+                _is_glue_ligolw_object(obj)
+                for obj in chain(args, kwargs.values())
+            )
+        if not use_compat:
+            return func(*args, **kwargs)
+        # alias the glue.ligolw modules under the ligo.lw names for
+        # the duration of this call, so that imports resolve to the
+        # old library without patching the import machinery
+        compat = _ligolw_compat_modules()
+        orig = {name: sys.modules.get(name) for name in compat}
+        sys.modules.update(compat)
         try:
-            if use_compat:
-                builtins.__import__ = _ligolw_compat_import
             return func(*args, **kwargs)
         finally:
-            builtins.__import__ = _real_import
+            for name, mod in orig.items():
+                if mod is None:
+                    sys.modules.pop(name, None)
+                else:
+                    sys.modules[name] = mod
     return wrapped
 
 
+@lru_cache(maxsize=None)
 def _get_ligolw_types(typename):
     """Utility function to return a tuple of type objects
     covering all LIGO_LW libraries
 
+    The result is cached, the LIGO_LW libraries don't change within
+    a process.
+
     This is designed purely for use with `isinstance`, and has
     not been tested for any other purpose.
 
@@ -129,12 +209,19 @@ def _get_ligolw_types(typename):
     (`isinstance` always returns false when given an empty type tuple)
     """
     types = []
-    for pkg in ("glue.ligolw", "ligo.lw"):
-        try:
-            ligolw = importlib.import_module(".ligolw", package=pkg)
-        except ImportError:
-            continue
-        types.append(getattr(ligolw, typename))
+    # glue.ligolw module names are never aliased by ilwdchar_compat,
+    # so importing here is safe
+    try:
+        glue_ligolw = importlib.import_module("glue.ligolw.ligolw")
+    except ImportError:
+        pass
+    else:
+        types.append(getattr(glue_ligolw, typename))
+    # use the real ligo.lw module captured at import time, so that the
+    # cached result is the same whether or not the first call happens
+    # inside an ilwdchar_compat-aliased context
+    if _ligolw_ligolw is not None:
+        types.append(getattr(_ligolw_ligolw, typename))
     return tuple(types)
 
 
@@ -165,10 +252,87 @@ def patch_ligotimegps(module="ligo.lw.lsctables"):
 
 # -- content handling ---------------------------------------------------------
 
+def _use_in(contenthandler):
+    """Wrap this content handler with `~ligo.lw.lsctables.use_in`
+
+    Skips handlers already wrapped with the same library's ``use_in``
+    (recorded via the ``_gwpy_use_in`` marker), so that the cached
+    handler classes built by this module aren't mutated again on every
+    read. A handler wrapped for one library is subclassed before
+    wrapping for the other (the ilwdchar_compat retry path), rather
+    than patched in place.
+    """
+    use_in = _import_ligolw("ligo.lw.lsctables").use_in
+    applied = getattr(contenthandler, "_gwpy_use_in", None)
+    if applied is use_in:
+        return contenthandler
+    if applied is not None:
+        contenthandler = type(contenthandler.__name__, (contenthandler,), {})
+    contenthandler = use_in(contenthandler)
+    contenthandler._gwpy_use_in = use_in
+    return contenthandler
+
+
+@lru_cache(maxsize=128)
+def _make_partial_contenthandler(element):
+    """Build (and cache) a `PartialLIGOLWContentHandler` for this element
+    """
+    PartialLIGOLWContentHandler = _import_ligolw(
+        "ligo.lw.ligolw").PartialLIGOLWContentHandler
+    Table = _import_ligolw("ligo.lw.table").Table
+
+    if issubclass(element, Table):
+        def _element_filter(name, attrs):
+            return element.CheckProperties(name, attrs)
+    else:
+        def _element_filter(name, _):
+            return name == element.tagName
+
+    handler = build_content_handler(
+        PartialLIGOLWContentHandler,
+        _element_filter,
+    )
+
+    if issubclass(element, Table):
+        # build instances of ``element`` itself, so that subclasses
+        # (e.g. with restricted ``loadcolumns``) take effect even
+        # though they aren't registered in ``lsctables.TableByName``
+        def _start_table(self, parent, attrs):
+            # pylint: disable=unused-argument
+            return element(attrs)
+
+        handler.startTable = _start_table
+
+    return handler
+
+
+@lru_cache(maxsize=128)
+def _make_filtering_contenthandler(element):
+    """Build (and cache) a `FilteringLIGOLWContentHandler` for this element
+    """
+    FilteringLIGOLWContentHandler = _import_ligolw(
+        "ligo.lw.ligolw").FilteringLIGOLWContentHandler
+    Table = _import_ligolw("ligo.lw.table").Table
+
+    if issubclass(element, Table):
+        def _element_filter(name, attrs):
+            return ~element.CheckProperties(name, attrs)
+    else:
+        def _element_filter(name, _):
+            # pylint: disable=unused-argument
+            return name != element.tagName
+
+    return build_content_handler(FilteringLIGOLWContentHandler,
+                                 _element_filter)
+
+
 @ilwdchar_compat
 def get_partial_contenthandler(element):
     """Build a `PartialLIGOLWContentHandler` to read only this element
 
+    The handler class is built once per element class and cached, since
+    `~ligo.lw.lsctables.use_in` walks the full table registry each time.
+
     Parameters
     ----------
     element : `type`, subclass of :class:`~ligo.lw.ligolw.Element`
@@ -180,23 +344,16 @@ def get_partial_contenthandler(element):
         a subclass of :class:`~ligo.lw.ligolw.PartialLIGOLWContentHandler`
         to read only the given `element`
     """
-    from ligo.lw.ligolw import PartialLIGOLWContentHandler
-    from ligo.lw.table import Table
-
-    if issubclass(element, Table):
-        def _element_filter(name, attrs):
-            return element.CheckProperties(name, attrs)
-    else:
-        def _element_filter(name, _):
-            return name == element.tagName
-
-    return build_content_handler(PartialLIGOLWContentHandler, _element_filter)
+    return _make_partial_contenthandler(element)
 
 
 @ilwdchar_compat
 def get_filtering_contenthandler(element):
     """Build a `FilteringLIGOLWContentHandler` to exclude this element
 
+    The handler class is built once per element class and cached, since
+    `~ligo.lw.lsctables.use_in` walks the full table registry each time.
+
     Parameters
     ----------
     element : `type`, subclass of :class:`~ligo.lw.ligolw.Element`
@@ -209,33 +366,19 @@ def get_filtering_contenthandler(element):
         :class:`~ligo.lw.ligolw.FilteringLIGOLWContentHandler` to
         exclude an element and its children
     """
-    from ligo.lw.ligolw import FilteringLIGOLWContentHandler
-    from ligo.lw.table import Table
-
-    if issubclass(element, Table):
-        def _element_filter(name, attrs):
-            return ~element.CheckProperties(name, attrs)
-    else:
-        def _element_filter(name, _):
-            # pylint: disable=unused-argument
-            return name != element.tagName
-
-    return build_content_handler(FilteringLIGOLWContentHandler,
-                                 _element_filter)
+    return _make_filtering_contenthandler(element)
 
 
 @ilwdchar_compat
 def build_content_handler(parent, filter_func):
     """Build a `~xml.sax.handler.ContentHandler` with a given filter
     """
-    from ligo.lw.lsctables import use_in
-
     class _ContentHandler(parent):
         # pylint: disable=too-few-public-methods
         def __init__(self, document):
             super().__init__(document, filter_func)
 
-    return use_in(_ContentHandler)
+    return _use_in(_ContentHandler)
 
 
 # -- reading ------------------------------------------------------------------
@@ -260,18 +403,25 @@ def read_ligolw(source, contenthandler=LIGOLWContentHandler, **kwargs):
     xmldoc : :class:`~ligo.lw.ligolw.Document`
         the document object as parsed from the file(s)
     """
-    from ligo.lw.ligolw import Document
-    from ligo.lw import types
-    from ligo.lw.lsctables import use_in
-    from ligo.lw.utils import (load_url, ligolw_add)
+    ligolw = _import_ligolw("ligo.lw.ligolw")
+    types = _import_ligolw("ligo.lw.types")
+    load_url = _import_ligolw("ligo.lw.utils").load_url
+    ligolw_add = _import_ligolw("ligo.lw.utils.ligolw_add")
 
     # mock ToPyType to link to numpy dtypes
-    topytype = types.ToPyType.copy()
-    for key in types.ToPyType:
-        if key in types.ToNumPyType:
-            types.ToPyType[key] = numpy.dtype(types.ToNumPyType[key]).type
-
-    contenthandler = use_in(contenthandler)
+    topytype = types.ToPyType
+    if topytype is _TOPYTYPE:  # swap in the precomputed mapping
+        types.ToPyType = _NUMPY_TOPYTYPE
+    else:  # glue.ligolw (or patched) mapping, build the overlay now
+        types.ToPyType = {
+            **topytype,
+            **{
+                key: numpy.dtype(types.ToNumPyType[key]).type
+                for key in topytype.keys() & types.ToNumPyType.keys()
+            },
+        }
+
+    contenthandler = _use_in(contenthandler)
 
     # read one or more files into a single Document
     source = file_list(source)
@@ -283,7 +433,7 @@ def read_ligolw(source, contenthandler=LIGOLWContentHandler, **kwargs):
                 **kwargs
             )
         return ligolw_add.ligolw_add(
-            Document(),
+            ligolw.Document(),
             source,
             contenthandler=contenthandler,
             **kwargs
@@ -291,7 +441,7 @@ def read_ligolw(source, contenthandler=LIGOLWContentHandler, **kwargs):
     except LigolwElementError as exc:
         # failed to read with ligo.lw,
         # try again with glue.ligolw (ilwdchar_compat)
-        if LIGO_LW_COMPAT_ERROR.search(str(exc)):
+        if LIGO_LW_COMPAT_ERROR.search(exc.args[0] if exc.args else ""):
             try:
                 return read_ligolw(
                     source,
@@ -338,6 +488,21 @@ def with_read_ligolw(func=None, contenthandler=None):  # pragma: no cover
 
 # -- reading ------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
+def _table_subset(tableclass, columns):
+    """Build a subclass of ``tableclass`` that only loads ``columns``
+
+    `read_table` uses the subclass to restrict parsing to the requested
+    columns without writing to the shared class object, which would not
+    be safe for concurrent reads.
+    """
+    return type(
+        tableclass.__name__,
+        (tableclass,),
+        {"loadcolumns": columns},
+    )
+
+
 @ilwdchar_compat
 def read_table(source, tablename=None, columns=None, contenthandler=None,
                **kwargs):
@@ -371,8 +536,9 @@ def read_table(source, tablename=None, columns=None, contenthandler=None,
     table : :class:`~ligo.lw.table.Table`
         `Table` of data
     """
-    from ligo.lw.ligolw import Document
-    from ligo.lw import (table, lsctables)
+    Document = _import_ligolw("ligo.lw.ligolw").Document
+    table = _import_ligolw("ligo.lw.table")
+    lsctables = _import_ligolw("ligo.lw.lsctables")
 
     # get ilwdchar_compat to pass to read_ligolw()
     if Document.__module__.startswith("glue"):
@@ -383,26 +549,23 @@ def read_table(source, tablename=None, columns=None, contenthandler=None,
         tableclass = lsctables.TableByName[
             table.Table.TableName(tablename)
         ]
-        if contenthandler is None:
-            contenthandler = get_partial_contenthandler(tableclass)
-
-        # overwrite loading column names to get just what was asked for
-        _oldcols = tableclass.loadcolumns
         if columns is not None:
-            tableclass.loadcolumns = columns
+            # restrict the loading column names via a subclass, rather
+            # than patching ``loadcolumns`` on the shared class object
+            readclass = _table_subset(tableclass, tuple(columns))
+        else:
+            readclass = tableclass
+        if contenthandler is None:
+            contenthandler = get_partial_contenthandler(readclass)
 
     # read document
     if isinstance(source, Document):
         xmldoc = source
     else:
         if contenthandler is None:
-            contenthandler = lsctables.use_in(LIGOLWContentHandler)
-        try:
-            xmldoc = read_ligolw(source, contenthandler=contenthandler,
-                                 **kwargs)
-        finally:  # reinstate original set of loading column names
-            if tablename is not None:
-                tableclass.loadcolumns = _oldcols
+            contenthandler = _use_in(LIGOLWContentHandler)
+        xmldoc = read_ligolw(source, contenthandler=contenthandler,
+                             **kwargs)
 
     # now find the right table
     if tablename is None:
@@ -442,11 +605,12 @@ def open_xmldoc(fobj, **kwargs):
         either the `Document` as parsed from an existing file, or a new, empty
         `Document`
     """
-    from ligo.lw.ligolw import (Document, LIGOLWContentHandler)
-    from ligo.lw.lsctables import use_in
-    from ligo.lw.utils import load_fileobj
+    ligolw = _import_ligolw("ligo.lw.ligolw")
+    load_fileobj = _import_ligolw("ligo.lw.utils").load_fileobj
 
-    use_in(kwargs.setdefault('contenthandler', LIGOLWContentHandler))
+    kwargs['contenthandler'] = _use_in(
+        kwargs.pop('contenthandler', ligolw.LIGOLWContentHandler),
+    )
 
     # read from an existing Path/filename
     if not isinstance(fobj, FILE_LIKE):
@@ -455,12 +619,12 @@ def open_xmldoc(fobj, **kwargs):
                 return open_xmldoc(fobj2, **kwargs)
         except (OSError, IOError):
             # or just create a new Document
-            return Document()
+            return ligolw.Document()
 
     try:
         out = load_fileobj(fobj, **kwargs)
     except LigolwElementError as exc:
-        if LIGO_LW_COMPAT_ERROR.search(str(exc)):
+        if LIGO_LW_COMPAT_ERROR.search(exc.args[0] if exc.args else ""):
             # handle ligo.lw/glue.ligolw compatibility issue
             try:
                 # load_fileobj will have closed the file, so we need to
@@ -479,11 +643,16 @@ def open_xmldoc(fobj, **kwargs):
 def get_ligolw_element(xmldoc):
     """Find an existing <LIGO_LW> element in this XML Document
     """
-    from ligo.lw.ligolw import WalkChildren
+    WalkChildren = _import_ligolw("ligo.lw.ligolw").WalkChildren
     ligolw_types = _get_ligolw_types("LIGO_LW")
 
     if isinstance(xmldoc, ligolw_types):
         return xmldoc
+    # the LIGO_LW element is normally a direct child of the Document,
+    # so check those before walking every descendant
+    for elem in getattr(xmldoc, "childNodes", ()):
+        if isinstance(elem, ligolw_types):
+            return elem
     for elem in WalkChildren(xmldoc):
         if isinstance(elem, ligolw_types):
             return elem
@@ -506,8 +675,7 @@ def write_tables_to_document(xmldoc, tables, overwrite=False):
         if `True`, delete an existing instance of the table type, otherwise
         append new rows
     """
-    from ligo.lw.ligolw import LIGO_LW
-    from ligo.lw import lsctables
+    LIGO_LW = _import_ligolw("ligo.lw.ligolw").LIGO_LW
 
     # find or create LIGO_LW tag
     try:
@@ -516,19 +684,25 @@ def write_tables_to_document(xmldoc, tables, overwrite=False):
         llw = LIGO_LW()
         xmldoc.appendChild(llw)
 
+    # map the tables that already exist in this document, walking
+    # the tree once rather than once per input table
+    existing = {
+        tbl.TableName(tbl.Name): tbl for tbl in iter_tables(llw)
+    }
+
     for table in tables:
-        try:  # append new data to existing table
-            old = lsctables.TableByName[
-                table.TableName(table.Name)].get_table(xmldoc)
-        except ValueError:  # or create a new table
+        name = table.TableName(table.Name)
+        old = existing.get(name)
+        if old is None:  # create a new table
             llw.appendChild(table)
-        else:
-            if overwrite:
-                llw.removeChild(old)
-                old.unlink()
-                llw.appendChild(table)
-            else:
-                old.extend(table)
+            existing[name] = table
+        elif overwrite:  # replace the existing table
+            llw.removeChild(old)
+            old.unlink()
+            llw.appendChild(table)
+            existing[name] = table
+        else:  # append new data to the existing table
+            old.extend(table)
 
     return xmldoc
 
@@ -556,17 +730,18 @@ def write_tables(target, tables, append=False, overwrite=False, **kwargs):
         other keyword arguments to pass to
         :func:`~ligo.lw.utils.load_fileobj` as appropriate
     """
-    from ligo.lw.ligolw import (Document, LIGO_LW, LIGOLWContentHandler)
-    from ligo.lw import utils as ligolw_utils
+    ligolw = _import_ligolw("ligo.lw.ligolw")
+    ligolw_utils = _import_ligolw("ligo.lw.utils")
 
     # allow writing directly to XML
-    if isinstance(target, (Document, LIGO_LW)):
+    if isinstance(target, (ligolw.Document, ligolw.LIGO_LW)):
         xmldoc = target
     # open existing document, if possible
     elif append:
         xmldoc = open_xmldoc(
             target,
-            contenthandler=kwargs.pop('contenthandler', LIGOLWContentHandler),
+            contenthandler=kwargs.pop('contenthandler',
+                                      ligolw.LIGOLWContentHandler),
         )
     # fail on existing document and not overwriting
     elif (
@@ -576,7 +751,7 @@ def write_tables(target, tables, append=False, overwrite=False, **kwargs):
     ):
         raise IOError("File exists: {}".format(target))
     else:  # or create a new document
-        xmldoc = Document()
+        xmldoc = ligolw.Document()
 
     # convert table to format
     write_tables_to_document(xmldoc, tables, overwrite=overwrite)
@@ -615,20 +790,42 @@ def iter_tables(source):
     ligo.lw.table.Table
         a table structure from the document(s)
     """
-    from ligo.lw.ligolw import (Stream, WalkChildren)
-
-    # get LIGO_LW object
-    if not isinstance(source, _get_ligolw_types("Element")):
-        filt = get_filtering_contenthandler(Stream)
+    ligolw = _import_ligolw("ligo.lw.ligolw")
+
+    # get LIGO_LW object, checking the module name first so that the
+    # common case of a file path skips the LIGO_LW type lookup entirely
+    mod = getattr(type(source), "__module__", "") or ""
+    if not (
+        mod.partition(".")[0] in ("ligo", "glue")
+        and isinstance(source, _get_ligolw_types("Element"))
+    ):
+        filt = get_filtering_contenthandler(ligolw.Stream)
         source = read_ligolw(source, contenthandler=filt)
     llw = get_ligolw_element(source)
 
     # yield tables
-    for elem in WalkChildren(llw):
+    for elem in ligolw.WalkChildren(llw):
         if elem.tagName == "Table":
             yield elem
 
 
+def _scan_table_names(files):
+    """Yield the ``Name`` of each ``<Table>`` element in the given XML files
+
+    This streams through each file using
+    `xml.etree.ElementTree.iterparse`, without building a document tree,
+    clearing each element as soon as it has been parsed to bound memory.
+    """
+    for path in files:
+        with gopen(path, mode="rb") as fobj:
+            for event, elem in iterparse(fobj, events=("start", "end")):
+                if event == "start":
+                    if elem.tag == "Table":
+                        yield elem.attrib["Name"]
+                else:
+                    elem.clear()
+
+
 @ilwdchar_compat
 def list_tables(source):
     """List the names of all tables in this file(s)
@@ -644,7 +841,17 @@ def list_tables(source):
     >>> print(list_tables('H1-LDAS_STRAIN-968654552-10.xml.gz'))
     ['process', 'process_params', 'sngl_burst', 'search_summary', 'segment_definer', 'segment_summary', 'segment']
     """  # noqa: E501
-    return [tbl.TableName(tbl.Name) for tbl in iter_tables(source)]
+    Table = _import_ligolw("ligo.lw.table").Table
+
+    # for a parsed Document (or other Element), walk the tree directly
+    if isinstance(source, _get_ligolw_types("Element")):
+        return [tbl.TableName(tbl.Name) for tbl in iter_tables(source)]
+
+    # otherwise stream-scan the file(s) without building a DOM
+    return [
+        Table.TableName(name)
+        for name in _scan_table_names(file_list(source))
+    ]
 
 
 @ilwdchar_compat
@@ -689,32 +896,105 @@ def to_table_type(val, cls, colname):
     >>> print(to_ligolw_type(pid, SnglBurstTable, 'process_id')))
     process:process_id:1
     """
-    from ligo.lw.types import (
-        ToNumPyType as numpytypes,
-        ToPyType as pytypes,
-    )
-
     # if nothing to do...
-    if val is None or colname not in cls.validcolumns:
+    if val is None:
+        return val
+    conv = _converter_for(
+        cls if isinstance(cls, type) else type(cls),
+        colname,
+    )
+    if conv is None:
         return val
+    return conv(val)
 
-    llwtype = cls.validcolumns[colname]
+
+@lru_cache(maxsize=4096)
+def _converter_for(cls, colname):
+    """Return a callable to cast values for a given LIGO_LW table column
+
+    Returns `None` if ``colname`` has no type mapping for this table,
+    meaning values should be passed through unmodified.
+    """
+    try:
+        llwtype = cls.validcolumns[colname]
+    except KeyError:
+        return None
 
     # don't mess with formatted IlwdChar
     if llwtype == 'ilwd:char':
-        return _to_ilwd(val, cls.tableName, colname,
-                        ilwdchar_compat=_is_glue_ligolw_object(cls))
+        compat = _is_glue_ligolw_object(cls)
+
+        def _convert(val):
+            return _to_ilwd(val, cls.tableName, colname,
+                            ilwdchar_compat=compat)
+
+        return _convert
+
     # otherwise map to numpy or python types
+    if _is_glue_ligolw_object(cls):
+        from glue.ligolw import types
+        try:
+            return numpy.sctypeDict[types.ToNumPyType[llwtype]]
+        except KeyError:
+            return types.ToPyType[llwtype]
+    scalar = _LLW_TO_NUMPY_SCALAR.get(llwtype)
+    if scalar is not None:
+        return scalar
+    return _import_ligolw("ligo.lw.types").ToPyType[llwtype]
+
+
+@ilwdchar_compat
+def to_table_column(vals, cls, colname):
+    """Cast an array of values to the correct type for a LIGO_LW table column
+
+    This is the vectorised counterpart of `to_table_type`: where the
+    column maps to a numpy type the whole array is converted in a single
+    :meth:`~numpy.ndarray.astype` call, otherwise values are converted
+    one-by-one as for `to_table_type`.
+
+    Parameters
+    ----------
+    vals : `numpy.ndarray`, iterable
+        the values to convert
+
+    cls : `type`, subclass of :class:`~ligo.lw.table.Table`
+        the table class to map against
+
+    colname : `str`
+        The name of the mapping column
+
+    Returns
+    -------
+    array : `numpy.ndarray`
+        the input ``vals`` cast to the correct type
+    """
+    if not isinstance(cls, type):
+        cls = type(cls)
     try:
-        return numpy.sctypeDict[numpytypes[llwtype]](val)
+        llwtype = cls.validcolumns[colname]
     except KeyError:
-        return pytypes[llwtype](val)
+        return vals
+    if llwtype != 'ilwd:char':  # ilwd:char must go via _to_ilwd
+        if _is_glue_ligolw_object(cls):
+            from glue.ligolw import types
+        else:
+            from ligo.lw import types
+        try:
+            dtype = numpy.dtype(types.ToNumPyType[llwtype])
+        except (KeyError, TypeError):  # no numpy mapping (e.g. lstring)
+            pass
+        else:
+            return numpy.asarray(vals).astype(dtype, copy=False)
+    conv = _converter_for(cls, colname)
+    return numpy.asarray([conv(val) for val in vals], dtype=object)
 
 
 @ilwdchar_compat
 def _to_ilwd(value, tablename, colname):
-    from ligo.lw.ilwd import (ilwdchar, get_ilwdchar_class)
-    from ligo.lw._ilwd import ilwdchar as IlwdChar
+    ilwd = _import_ligolw("ligo.lw.ilwd")
+    ilwdchar = ilwd.ilwdchar
+    get_ilwdchar_class = ilwd.get_ilwdchar_class
+    IlwdChar = _import_ligolw("ligo.lw._ilwd").ilwdchar
 
     if isinstance(value, IlwdChar) and value.column_name != colname:
         raise ValueError("ilwdchar '{0!s}' doesn't match column "
@@ -736,23 +1016,16 @@ def is_ligolw(origin, filepath, fileobj, *args, **kwargs):
         loc = fileobj.tell()
         fileobj.seek(0)
         try:
-            line1 = fileobj.readline().lower()
-            line2 = fileobj.readline().lower()
-            try:
-                return (
-                    line1.startswith(XML_SIGNATURE)
-                    and line2.startswith((LIGOLW_SIGNATURE, LIGOLW_ELEMENT))
-                )
-            except TypeError:  # bytes vs str
-                return (
-                    line1.startswith(XML_SIGNATURE.decode('utf-8'))
-                    and line2.startswith((
-                        LIGOLW_SIGNATURE.decode('utf-8'),
-                        LIGOLW_ELEMENT.decode('utf-8'),
-                    ))
-                )
+            buf = fileobj.read(128)
         finally:
             fileobj.seek(loc)
+        if not isinstance(buf, bytes):  # text-mode file
+            buf = buf.encode("utf-8", "replace")
+        buf = buf.lower()
+        return buf.startswith(XML_SIGNATURE) and (
+            LIGOLW_SIGNATURE in buf
+            or LIGOLW_ELEMENT in buf
+        )
 
     element_types = _get_ligolw_types("Element")
     return len(args) > 0 and isinstance(args[0], element_types)
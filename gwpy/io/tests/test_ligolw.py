@@ -125,6 +125,27 @@ def test_read_table_empty(llwdoc):
     assert str(exc.value) == "No tables found in LIGO_LW document(s)"
 
 
+@skip_missing_dependency('ligo.lw.lsctables')
+def test_read_table_columns(tmp_path):
+    tab = new_table(
+        'sngl_burst',
+        [{'snr': 1., 'central_freq': 100.}, {'snr': 2., 'central_freq': 200.}],
+        columns=('snr', 'central_freq'),
+    )
+    tmp = tmp_path / "test.xml"
+    io_ligolw.write_tables(tmp, [tab])
+
+    # check that only the requested columns are loaded
+    out = io_ligolw.read_table(tmp, tablename='sngl_burst', columns=['snr'])
+    assert [row.snr for row in out] == [1., 2.]
+    with pytest.raises(AttributeError):
+        getattr(out[0], 'central_freq')
+
+    # and that reading without a column restriction still loads everything
+    out = io_ligolw.read_table(tmp, tablename='sngl_burst')
+    assert [row.central_freq for row in out] == [100., 200.]
+
+
 def test_read_table_multiple(llwdoc_with_tables):
     # check that read_table correctly errors on ambiguity
     with pytest.raises(ValueError) as exc:
@@ -227,6 +248,41 @@ def test_to_table_type_glue_ligolw(value, name, result):
     assert out == result
 
 
+@skip_missing_dependency('ligo.lw.lsctables')
+def test_to_table_column():
+    # 'snr' is 'real_4', so should map straight to a float32 array
+    from ligo.lw.lsctables import SnglBurstTable
+    out = io_ligolw.to_table_column([1., 2., 3.], SnglBurstTable, 'snr')
+    assert out.dtype == numpy.dtype('float32')
+    numpy.testing.assert_array_equal(out, [1., 2., 3.])
+
+    # unknown columns pass straight through
+    vals = [1., 2., 3.]
+    assert io_ligolw.to_table_column(vals, SnglBurstTable, 'blah') is vals
+
+
+@skip_missing_dependency('ligo.lw.lsctables')
+def test_to_table_column_pytype():
+    # 'program' is 'lstring', which has no numpy mapping, so values
+    # should go through ToPyType element-by-element
+    from ligo.lw.lsctables import ProcessTable
+    out = io_ligolw.to_table_column([1, 2], ProcessTable, 'program')
+    assert out.dtype == numpy.dtype(object)
+    assert list(out) == ['1', '2']
+
+
+@skip_missing_dependency('glue.ligolw.lsctables')
+def test_to_table_column_ilwd():
+    # 'process_id' is 'ilwd:char' in glue, so should come back as
+    # an object array of ilwdchar instances
+    from glue.ligolw.lsctables import SnglBurstTable
+    from glue.ligolw._ilwd import ilwdchar as IlwdChar
+    out = io_ligolw.to_table_column([0, 1], SnglBurstTable, 'process_id')
+    assert out.dtype == numpy.dtype(object)
+    assert isinstance(out[0], IlwdChar)
+    assert str(out[0]) == 'sngl_burst:process_id:0'
+
+
 def test_write_tables_to_document(llwdoc_with_tables):
     # create new table
     def _new():
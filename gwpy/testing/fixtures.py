@@ -41,7 +41,7 @@ from .utils import TemporaryFilename
 @pytest.fixture
 @deprecated_function
 def tmpfile():
-    """Return a temporary filename using `tempfile.mktemp`.
+    """Return a temporary filename using `tempfile.NamedTemporaryFile`.
 
     The fixture **does not create the named file**, but will delete it
     when the test exists if it was created in the mean time.
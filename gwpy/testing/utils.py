@@ -213,7 +213,11 @@ def assert_table_equal(a, b, is_copy=True, meta=False, check_types=True,
         colb = b[name]
         if check_types:
             assert cola.dtype == colb.dtype
-        assert_array(cola, colb)
+        # cheap C-level equality pre-check before escalating to the
+        # assertion helpers, which compare (and format messages)
+        # element-by-element in Python
+        if not numpy.array_equal(cola, colb):
+            assert_array(cola, colb)
 
     # check that the tables are copied or the same data
     for name in a.colnames:
@@ -269,13 +273,15 @@ def assert_zpk_equal(a, b, almost_equal=False):
 
 @contextmanager
 @deprecated_function
-def TemporaryFilename(*args, **kwargs):  # pylint: disable=invalid-name
+def TemporaryFilename(**kwargs):  # pylint: disable=invalid-name
     """Create and return a temporary filename
 
-    Calls `tempfile.mktemp` to create a temporary filename, and deletes
-    the named file (if it exists) when the context ends.
+    Calls `tempfile.NamedTemporaryFile` to reserve a temporary filename,
+    removing the file straight away, and deletes the named file (if it
+    exists) when the context ends.
 
-    This method **does not create the named file**.
+    This method **does not create the named file**; arguments must be
+    given by keyword, as for `tempfile.NamedTemporaryFile`.
 
     Examples
     --------
@@ -283,12 +289,16 @@ def TemporaryFilename(*args, **kwargs):  # pylint: disable=invalid-name
     ...     print(tmp)
     '/var/folders/xh/jdrqg2bx3s5f4lkq0rf2903c0000gq/T/tmpnNxivL.txt'
     """
-    name = tempfile.mktemp(*args, **kwargs)
+    with tempfile.NamedTemporaryFile(delete=False, **kwargs) as tmp:
+        name = tmp.name
+    os.unlink(name)
     try:
         yield name
     finally:
-        if os.path.isfile(name):
+        try:
             os.remove(name)
+        except FileNotFoundError:
+            pass
 
 
 def test_read_write(data, format,